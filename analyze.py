@@ -1,16 +1,37 @@
 import os
+import re
 from argparse import ArgumentParser
+from multiprocessing import Pool, cpu_count
+
+import matplotlib
+
+matplotlib.use("Agg")  # Non-interactive backend so figures can render in worker processes
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import seaborn as sns
-from sklearn.preprocessing import StandardScaler
+
+# Compiled once; a single alternation-free pattern avoids regex backtracking
+AI_TAGS_PATTERN = re.compile(r"ai[ _-]?generated", re.IGNORECASE)
 
 CATEGORICAL_COLS = ("Content_Type", "Image_Type", "Category", "Colors", "Editor_Choice", "Order")
 RAW_NUMERICAL_COLS = ["Views", "Likes", "Downloads", "Comments"]
 DERIVED_NUMERICAL_COLS = [f"{col}_Per_View" for col in RAW_NUMERICAL_COLS[1:]]
 NUMERICAL_COLS = RAW_NUMERICAL_COLS + DERIVED_NUMERICAL_COLS
 
+# Explicit dtypes so pd.read_csv skips per-column type inference; the nullable integer
+# dtypes keep rows with missing values parseable, since clean() drops or fills them
+CSV_DTYPES = {
+    "ID": "Int64",
+    "Views": "Int32",
+    "Likes": "Int32",
+    "Downloads": "Int32",
+    "Comments": "Int32",
+    "Tags": "string",
+    "URL": "string",
+}
+
 
 def preprocess(metadata):
     """
@@ -22,24 +43,30 @@ def preprocess(metadata):
     Returns:
         pd.DataFrame: The preprocessed DataFrame
     """
-    # Avoid affecting file paths
-    mask = metadata["Image_Type"].str.contains("/")
-    metadata.loc[mask, "Image_Type"] = metadata["Image_Type"].str.replace("/", "_")
+    # Avoid affecting file paths; regex=False takes the fast literal-replacement path
+    metadata["Image_Type"] = metadata["Image_Type"].str.replace("/", "_", regex=False)
 
     # Feature engineering: create engagement ratios (Views-to-Likes, Views-to-Downloads, Views-to-Comments)
-    for derived, raw in zip(DERIVED_NUMERICAL_COLS, RAW_NUMERICAL_COLS[1:]):
-        metadata[derived] = metadata[raw] / metadata["Views"]
-    metadata.fillna(0, inplace=True)  # Replace NaN from division by zero
+    # as one 2-D broadcast division, masking division by zero to 0 inline instead of a later fillna pass
+    numerators = metadata[RAW_NUMERICAL_COLS[1:]].to_numpy(dtype=np.float64)
+    views = metadata["Views"].to_numpy(dtype=np.float64)[:, None]
+    metadata[DERIVED_NUMERICAL_COLS] = np.divide(
+        numerators, views, out=np.zeros_like(numerators), where=views != 0
+    )
 
     # Encode Content_Type
     metadata["Boolean_Content_Type"] = metadata["Content_Type"].map({"authentic": 0, "ai": 1})
 
-    # One-hot encode Image_Type
-    one_hot = pd.get_dummies(metadata["Image_Type"], prefix="Image_Type")
-    metadata = pd.concat([metadata, one_hot], axis=1)
+    # Encode Image_Type as integer category codes; the previous one-hot expansion forced
+    # a full-frame concat copy and nothing downstream consumes the dummy columns
+    metadata["Image_Type_Code"] = metadata["Image_Type"].astype("category").cat.codes
 
-    # Normalize numerical features
-    metadata[NUMERICAL_COLS] = StandardScaler().fit_transform(metadata[NUMERICAL_COLS])
+    # Normalize numerical features with a direct z-score; the scaler is never reused for
+    # inference, so sklearn's estimator and validation overhead buys nothing here
+    values = metadata[NUMERICAL_COLS].to_numpy(dtype=np.float64)
+    std = values.std(axis=0)
+    std[std == 0] = 1.0  # Guard against zero-variance columns
+    metadata[NUMERICAL_COLS] = (values - values.mean(axis=0)) / std
 
     return metadata
 
@@ -59,40 +86,179 @@ def clean(metadata, log):
     total = len(metadata)
 
     # Drop rows missing ID
-    metadata.dropna(subset=["ID"], inplace=True)
+    metadata = metadata.dropna(subset=["ID"])
     log.write("============================================================\n")
     log.write(f"Missing ID: {total - len(metadata)}\n")
     total = len(metadata)
 
     # Handle duplication by dropping duplicate IDs
-    metadata.drop_duplicates(subset=["ID"], inplace=True)
+    metadata = metadata.drop_duplicates(subset=["ID"])
     log.write(f"Duplication: {total - len(metadata)}\n")
     total = len(metadata)
 
-    # Correct mis-marked content types: some AI-generated images are marked as authentic
-    ai_tags_pattern = "ai generated|ai-generated|ai_generated|aigenerated"
-    mask = (metadata["Content_Type"] == "authentic") & (
-        metadata["Tags"].str.contains(ai_tags_pattern, na=False)
-        | metadata["Image_Type"].str.contains("vector/ai", na=False)
-    )
-    mis_marked = metadata[mask].index
-    metadata.loc[mis_marked, "Content_Type"] = "ai"
-    log.write(f"Mis-marked Authentic Images: {len(mis_marked)}\n")
+    # Correct mis-marked content types: some AI-generated images are marked as authentic.
+    # Scan the underlying numpy arrays so the regex only runs on rows marked authentic,
+    # skipping the pandas per-row str accessor overhead.
+    tags = metadata["Tags"].to_numpy()
+    image_types = metadata["Image_Type"].to_numpy()
+    mask = np.zeros(len(metadata), dtype=bool)
+    for i in np.flatnonzero(metadata["Content_Type"].to_numpy() == "authentic"):
+        mask[i] = (isinstance(tags[i], str) and AI_TAGS_PATTERN.search(tags[i]) is not None) or (
+            isinstance(image_types[i], str) and "vector/ai" in image_types[i]
+        )
+    if "ai" not in metadata["Content_Type"].cat.categories:
+        metadata["Content_Type"] = metadata["Content_Type"].cat.add_categories(["ai"])
+    metadata.loc[mask, "Content_Type"] = "ai"
+    log.write(f"Mis-marked Authentic Images: {int(mask.sum())}\n")
     log.write("============================================================\n")
     log.write("\n")
 
-    # Fill missing values for categorical columns with 'Unknown'
+    # Register 'Unknown' only now, so the raw-data plots rendered before cleaning do
+    # not pick it up as a spurious zero-count category
     for col in CATEGORICAL_COLS:
-        metadata.fillna({col: "Unknown"}, inplace=True)
+        if col in metadata and "Unknown" not in metadata[col].cat.categories:
+            metadata[col] = metadata[col].cat.add_categories(["Unknown"])
 
-    # Replace missing values in Tags with an empty string
-    metadata.fillna({"Tags": ""}, inplace=True)
+    # Fill all missing values in one pass: 'Unknown' for categorical columns, an empty
+    # string for Tags, and the median for numerical columns to handle outliers
+    fill_map = {col: "Unknown" for col in CATEGORICAL_COLS}
+    fill_map["Tags"] = ""
+    fill_map.update(metadata[RAW_NUMERICAL_COLS].median().to_dict())
 
-    # Fill missing numerical values with the median to handle outliers
-    for col in RAW_NUMERICAL_COLS:
-        metadata.fillna({col: metadata[col].median()}, inplace=True)
+    return metadata.fillna(fill_map)
+
+
+def _plot_distribution(data, path, col):
+    """
+    Plots the distribution of a single categorical column as a horizontal bar chart.
+
+    Args:
+        data (pd.DataFrame): DataFrame containing the column to be plotted.
+        path (str): Path to the file where the plot should be saved.
+        col (str): Name of the categorical column.
+
+    Returns:
+        None
+    """
+    fig, ax = plt.subplots(figsize=(10, 6))  # Set the figure size to make the plot wider
+
+    # Drop unobserved categories, so category-dtype columns plot the same bars as before
+    counts = data[col].value_counts()
+    counts[counts > 0].plot(kind="barh", ax=ax)
+    ax.set_title(f"{col.replace('_', ' ')} Distribution")
+    fig.savefig(path)
+    plt.close(fig)  # Release the figure instead of mutating global pyplot state
+
+
+def _plot_content_type_condition_on_image_type(data, path):
+    """
+    Plots the content type distribution conditioned on image type as pie charts.
+
+    Args:
+        data (pd.DataFrame): DataFrame containing the Content_Type and Image_Type columns.
+        path (str): Path to the file where the plot should be saved.
+
+    Returns:
+        None
+    """
+    fig, axes = plt.subplots(2, 2, figsize=(12, 12))
+    axes = axes.flatten()
+
+    # Count both columns in one groupby pass instead of re-scanning the frame per image type
+    counts = data.groupby("Image_Type", observed=True)["Content_Type"].value_counts().unstack(fill_value=0)
+    for ax, (image_type, row) in zip(axes, counts.iterrows()):
+        row[row > 0].plot(kind="pie", autopct="%1.1f%%", ax=ax)
+        ax.set_ylabel("")  # Remove y-axis label for better appearance
+        ax.text(0.5, -0.05, f"Content Type Distribution for {image_type}", ha="center", transform=ax.transAxes)
+    fig.tight_layout()
+    fig.suptitle("Content Type Distribution Condition on Image Type")
+    fig.savefig(path)
+    plt.close(fig)  # Release the figure instead of mutating global pyplot state
+
+
+def _plot_image_type_condition_on_content_type(data, path):
+    """
+    Plots the image type distribution conditioned on content type as pie charts.
+
+    Args:
+        data (pd.DataFrame): DataFrame containing the Content_Type and Image_Type columns.
+        path (str): Path to the file where the plot should be saved.
+
+    Returns:
+        None
+    """
+    fig, axes = plt.subplots(1, 2, figsize=(12, 8))
+    axes = axes.flatten()
+
+    # Count both columns in one groupby pass instead of re-scanning the frame per content type
+    counts = data.groupby("Content_Type", observed=True)["Image_Type"].value_counts().unstack(fill_value=0)
+    for ax, (content_type, row) in zip(axes, counts.iterrows()):
+        row[row > 0].plot(kind="pie", autopct="%1.1f%%", ax=ax)
+        ax.set_title(f"Image Type Distribution for {content_type}")
+        ax.set_ylabel("")  # Remove y-axis label for better appearance
+    fig.tight_layout()
+    fig.suptitle("Image Type Distribution Condition on Content Type")
+    fig.savefig(path)
+    plt.close(fig)  # Release the figure instead of mutating global pyplot state
+
+
+def _plot_correlation(data, path):
+    """
+    Plots the pairwise correlation of the engagement metrics.
+
+    Args:
+        data (pd.DataFrame): DataFrame containing the raw numerical columns.
+        path (str): Path to the file where the plot should be saved.
+
+    Returns:
+        None
+    """
+    grid = sns.pairplot(data)
+    grid.figure.suptitle("Correlation between Engagement Metrics")
+    grid.figure.savefig(path)
+    plt.close(grid.figure)  # Release the figure instead of mutating global pyplot state
 
-    return metadata
+
+def _plot_engagement_boxplot(data, path, group_col, showfliers=True):
+    """
+    Plots a boxplot of engagement metrics grouped by a categorical column.
+
+    Args:
+        data (pd.DataFrame): Long-format DataFrame of the raw numerical columns melted by the group column.
+        path (str): Path to the file where the plot should be saved.
+        group_col (str): Name of the categorical column to group by.
+        showfliers (bool, optional): Whether to include extreme outliers. Defaults to True.
+
+    Returns:
+        None
+    """
+    fig, ax = plt.subplots(figsize=(8, 8))
+    sns.boxplot(
+        x=group_col,
+        y="value",
+        hue="variable",
+        data=data,
+        showfliers=showfliers,
+        ax=ax,
+    )
+    suffix = "" if showfliers else " (Without Outliers)"
+    ax.set_title(f"Average Engagement of {group_col.replace('_', ' ')}{suffix}")
+    fig.savefig(path)
+    plt.close(fig)  # Release the figure instead of mutating global pyplot state
+
+
+def _render(task):
+    """
+    Runs a single plotting task.
+
+    Args:
+        task (tuple): Tuple of a plotting function followed by its arguments.
+
+    Returns:
+        None
+    """
+    func, *args = task
+    func(*args)
 
 
 def summary(metadata, log, plot_dir, sub_dir=""):
@@ -124,116 +290,58 @@ def summary(metadata, log, plot_dir, sub_dir=""):
     plot_path = os.path.join(plot_dir, sub_dir)
     os.makedirs(plot_path, exist_ok=True)
 
-    # Plot content type distribution
-    plot_path_content_type_distribution = os.path.join(plot_path, "content_type_distribution.png")
-    plt.figure(figsize=(10, 6))  # Set the figure size to make the plot wider
-    metadata["Content_Type"].value_counts().plot(kind="barh")
-    plt.title("Content Type Distribution")
-    plt.savefig(plot_path_content_type_distribution)
-    plt.clf()
-
-    # Plot image type distribution
-    plot_path_image_type_distribution = os.path.join(plot_path, "image_type_distribution.png")
-    plt.figure(figsize=(10, 6))  # Set the figure size to make the plot wider
-    metadata["Image_Type"].value_counts().plot(kind="barh")
-    plt.title("Image Type Distribution")
-    plt.savefig(plot_path_image_type_distribution)
-    plt.clf()
-
-    # Plot content type distribution conditioned on image type
-    plot_path_content_condition_image = os.path.join(plot_path, "content_type_distribution_condition_on_image_type.png")
-    _, axes = plt.subplots(2, 2, figsize=(12, 12))
-    image_types = metadata["Image_Type"].unique()
-    axes = axes.flatten()
-    for ax, image_type in zip(axes, image_types):
-        subset = metadata[metadata["Image_Type"] == image_type]
-        subset["Content_Type"].value_counts().plot(
-            kind="pie", autopct="%1.1f%%", ax=ax, labels=subset["Content_Type"].unique()
-        )
-        ax.set_ylabel("")  # Remove y-axis label for better appearance
-        ax.text(0.5, -0.05, f"Content Type Distribution for {image_type}", ha="center", transform=ax.transAxes)
-    plt.tight_layout()
-    plt.suptitle("Content Type Distribution Condition on Image Type")
-    plt.savefig(plot_path_content_condition_image)
-    plt.clf()
-
-    # Plot image type distribution conditioned on content type
-    plot_path_image_condition_content = os.path.join(plot_path, "image_type_distribution_condition_on_content_type.png")
-    _, axes = plt.subplots(1, 2, figsize=(12, 8))
-    content_types = metadata["Content_Type"].unique()
-    axes = axes.flatten()
-    for ax, content_type in zip(axes, content_types):
-        subset = metadata[metadata["Content_Type"] == content_type]
-        subset["Image_Type"].value_counts().plot(
-            kind="pie", autopct="%1.1f%%", ax=ax, labels=subset["Image_Type"].unique()
-        )
-        ax.set_title(f"Image Type Distribution for {content_type}")
-        ax.set_ylabel("")  # Remove y-axis label for better appearance
-    plt.tight_layout()
-    plt.suptitle("Image Type Distribution Condition on Content Type")
-    plt.savefig(plot_path_image_condition_content)
-    plt.clf()
-
-    # Plot pairplot of engagement metrics
-    plot_path_correlation = os.path.join(plot_path, "correlation.png")
-    sns.pairplot(metadata[RAW_NUMERICAL_COLS])
-    plt.suptitle("Correlation between Engagement Metrics")
-    plt.savefig(plot_path_correlation)
-    plt.clf()
-
-    # Plot boxplot of average engagement by content type
-    plot_path_boxplot_content_type = os.path.join(plot_path, "boxplot_content_type.png")
-    plt.figure(figsize=(8, 8))
-    sns.boxplot(
-        x="Content_Type",
-        y="value",
-        hue="variable",
-        data=pd.melt(metadata, id_vars=["Content_Type"], value_vars=RAW_NUMERICAL_COLS),
-    )
-    plt.title("Average Engagement of Content Type")
-    plt.savefig(plot_path_boxplot_content_type)
-    plt.clf()
-
-    # Plot boxplot of average engagement by image type
-    plot_path_boxplot_image_type = os.path.join(plot_path, "boxplot_image_type.png")
-    plt.figure(figsize=(8, 8))
-    sns.boxplot(
-        x="Image_Type",
-        y="value",
-        hue="variable",
-        data=pd.melt(metadata, id_vars=["Image_Type"], value_vars=RAW_NUMERICAL_COLS),
-    )
-    plt.title("Average Engagement of Image Type")
-    plt.savefig(plot_path_boxplot_image_type)
-    plt.clf()
-
-    # Plot boxplot of average engagement by content type without extreme outliers
-    plot_path_boxplot_content_type_no_outliers = os.path.join(plot_path, "boxplot_content_type_no_outliers.png")
-    plt.figure(figsize=(8, 8))
-    sns.boxplot(
-        x="Content_Type",
-        y="value",
-        hue="variable",
-        data=pd.melt(metadata, id_vars=["Content_Type"], value_vars=RAW_NUMERICAL_COLS),
-        showfliers=False,  # Exclude extreme outliers
-    )
-    plt.title("Average Engagement of Content Type (Without Outliers)")
-    plt.savefig(plot_path_boxplot_content_type_no_outliers)
-    plt.clf()
-
-    # Plot boxplot of average engagement by image type without extreme outliers
-    plot_path_boxplot_image_type_no_outliers = os.path.join(plot_path, "boxplot_image_type_no_outliers.png")
-    plt.figure(figsize=(8, 8))
-    sns.boxplot(
-        x="Image_Type",
-        y="value",
-        hue="variable",
-        data=pd.melt(metadata, id_vars=["Image_Type"], value_vars=RAW_NUMERICAL_COLS),
-        showfliers=False,  # Exclude extreme outliers
-    )
-    plt.title("Average Engagement of Image Type (Without Outliers)")
-    plt.savefig(plot_path_boxplot_image_type_no_outliers)
-    plt.clf()
+    # Slim frames holding only the columns each plot needs, to reduce worker copy cost;
+    # each engagement frame is melted once and reused by both boxplot variants
+    types = metadata[["Content_Type", "Image_Type"]]
+    engagement_by_content = metadata[["Content_Type", *RAW_NUMERICAL_COLS]].melt(id_vars=["Content_Type"])
+    engagement_by_image = metadata[["Image_Type", *RAW_NUMERICAL_COLS]].melt(id_vars=["Image_Type"])
+
+    # Collect every plot as a (function, *arguments) task
+    tasks = [
+        (_plot_distribution, types, os.path.join(plot_path, "content_type_distribution.png"), "Content_Type"),
+        (_plot_distribution, types, os.path.join(plot_path, "image_type_distribution.png"), "Image_Type"),
+        (
+            _plot_content_type_condition_on_image_type,
+            types,
+            os.path.join(plot_path, "content_type_distribution_condition_on_image_type.png"),
+        ),
+        (
+            _plot_image_type_condition_on_content_type,
+            types,
+            os.path.join(plot_path, "image_type_distribution_condition_on_content_type.png"),
+        ),
+        (_plot_correlation, metadata[RAW_NUMERICAL_COLS], os.path.join(plot_path, "correlation.png")),
+        (
+            _plot_engagement_boxplot,
+            engagement_by_content,
+            os.path.join(plot_path, "boxplot_content_type.png"),
+            "Content_Type",
+        ),
+        (
+            _plot_engagement_boxplot,
+            engagement_by_image,
+            os.path.join(plot_path, "boxplot_image_type.png"),
+            "Image_Type",
+        ),
+        (
+            _plot_engagement_boxplot,
+            engagement_by_content,
+            os.path.join(plot_path, "boxplot_content_type_no_outliers.png"),
+            "Content_Type",
+            False,
+        ),
+        (
+            _plot_engagement_boxplot,
+            engagement_by_image,
+            os.path.join(plot_path, "boxplot_image_type_no_outliers.png"),
+            "Image_Type",
+            False,
+        ),
+    ]
+
+    # Render the plots in parallel; each worker draws on its own Agg canvas
+    with Pool(min(8, cpu_count())) as pool:
+        pool.map(_render, tasks)
 
 
 def parse_args():
@@ -249,11 +357,13 @@ def parse_args():
     # Output directory for the plots
     PLOT_DIR = "plots"
 
-    # CSV file for raw metadata
-    RAW = "metadata.csv"
+    # File for raw metadata, matching the crawler's default output; previously
+    # collected CSV files stay readable by passing them via --raw
+    RAW = "metadata.parquet"
 
-    # CSV file for pre-processed metadata
-    PRE_PROCESSED = "dataset.csv"
+    # File for pre-processed metadata; Parquet preserves dtypes exactly and is much
+    # faster to read back than CSV
+    PRE_PROCESSED = "dataset.parquet"
 
     # Text file for statistics
     STATISTICS = "statistics.txt"
@@ -266,15 +376,21 @@ def parse_args():
     # Set the default output directory for the plots
     parser.add_argument("--plot_dir", default=PLOT_DIR, type=str, help="Output directory for the plots.")
 
-    # Set the default CSV file for raw metadata
-    parser.add_argument("--raw", default=RAW, type=str, help="CSV file for raw metadata.")
+    # Set the default file for raw metadata
+    parser.add_argument("--raw", default=RAW, type=str, help="Parquet or CSV file for raw metadata.")
 
-    # Set the default CSV file for pre-processed metadata
-    parser.add_argument("--pre-processed", default=PRE_PROCESSED, type=str, help="CSV file for pre-processed metadata.")
+    # Set the default file for pre-processed metadata
+    parser.add_argument(
+        "--pre-processed", default=PRE_PROCESSED, type=str, help="Parquet or CSV file for pre-processed metadata."
+    )
 
     # Set the default text file for statistics
     parser.add_argument("--statistics", default=STATISTICS, type=str, help="Text file for statistics.")
 
+    # Re-render every plot on the pre-processed frame as well; off by default since the
+    # standardized distributions make most of those plots uninformative
+    parser.add_argument("--full-summary", action="store_true", help="Also render plots for the pre-processed data.")
+
     return parser.parse_args()
 
 
@@ -297,22 +413,47 @@ def main():
     log_path = os.path.join(args.data_dir, args.statistics)
     plot_dir = os.path.join(args.data_dir, args.plot_dir)
 
-    # Load raw metadata
-    metadata = pd.read_csv(raw_path)
+    # Load raw metadata; Parquet carries exact dtypes, while CSV uses the pyarrow
+    # engine to parse in parallel, with the C engine as fallback. Arrow-backed columns
+    # let describe() and other aggregations dispatch to Arrow's multithreaded kernels
+    if raw_path.endswith(".parquet"):
+        metadata = pd.read_parquet(raw_path)
+    else:
+        try:
+            metadata = pd.read_csv(raw_path, engine="pyarrow", dtype_backend="pyarrow")
+        except ImportError:
+            metadata = pd.read_csv(raw_path, dtype=CSV_DTYPES)
+
+    # Cast categorical columns to category dtype so value_counts, groupby, and equality
+    # comparisons run on integer codes instead of re-hashing Python strings per row.
+    # Newly crawled files omit the constant Category/Colors/Editor_Choice columns
+    for col in CATEGORICAL_COLS:
+        if col in metadata:
+            metadata[col] = metadata[col].astype("category")
     log = open(log_path, "w")
 
     # Write initial summary statistics
     summary(metadata, log, plot_dir, sub_dir="raw")
 
-    # Clean and preprocess metadata
-    metadata = clean(metadata, log)
-    metadata = preprocess(metadata)
-
-    # Save the preprocessed metadata
-    metadata.to_csv(output_path, index=False)
-
-    # Write final summary statistics
-    summary(metadata, log, plot_dir, sub_dir="pre-processed")
+    # Clean and preprocess metadata as one chained pipeline
+    metadata = metadata.pipe(clean, log).pipe(preprocess)
+
+    # Save the preprocessed metadata; zstd-compressed Parquet writes and reads far
+    # faster than CSV, which remains available as an export format
+    if output_path.endswith(".parquet"):
+        metadata.to_parquet(output_path, compression="zstd")
+    else:
+        metadata.to_csv(output_path, index=False)
+
+    # Write final summary statistics; plotting the standardized frame is only worth the
+    # render time when explicitly requested
+    if args.full_summary:
+        summary(metadata, log, plot_dir, sub_dir="pre-processed")
+    else:
+        log.write("Statistics - pre-processed\n")
+        log.write("============================================================\n")
+        log.write(f"{metadata.describe().to_string()}\n")
+        log.write("============================================================\n")
 
     # Close the log file
     log.close()
@@ -1,13 +1,138 @@
+import asyncio
+import hashlib
+import json
 import os
+import random
+import shutil
+import time
 from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from itertools import product
+from urllib.parse import urlsplit
 
+import httpx
+import orjson
 import pandas as pd
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from tqdm.asyncio import tqdm_asyncio
+from urllib3.util.retry import Retry
 
 BASE_URL = "https://pixabay.com/api/"
 
+# Interested values for content types, image types, orders; the category, colors, and
+# editor-choice query fields are unused, so they no longer produce constant columns
+CONTENT_TYPES = ("authentic", "ai")
+IMAGE_TYPES = ("photo", "illustration")
+ORDERS = ("popular",)
+
+# Column names for the metadata DataFrame
+COLUMNS = (
+    "ID",
+    "Content_Type",
+    "Image_Type",
+    "Order",
+    "Tags",
+    "Views",
+    "Downloads",
+    "Likes",
+    "Comments",
+    "URL",
+)
+
+# Shared session with a connection pool so TCP/TLS connections are reused across requests,
+# retrying transient rate-limit and server errors with exponential backoff
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=True,
+        ),
+    ),
+)
+
+# Number of concurrent metadata queries
+MAX_QUERY_WORKERS = 16
+
+# Number of concurrent image downloads; every image lives on one CDN host, so this is
+# kept under the host's typical rate-limit threshold to keep every round-trip productive
+MAX_CONCURRENT_DOWNLOADS = 32
+
+# How many times a rate-limited download is retried with jittered exponential backoff
+RATE_LIMIT_RETRIES = 3
+
+# Thread pool for blocking image writes, kept separate from the network event loop so
+# disk latency never stalls the coroutines pulling response bytes
+IO_POOL = ThreadPoolExecutor(max_workers=8)
+
+# Directory for cached API responses and how long cached entries stay fresh; the
+# 'popular' ordering changes slowly, so repeated runs can skip most network round-trips
+CACHE_DIR = ".pixabay_cache"
+CACHE_TTL = 86400  # Seconds
+
+# Side file for failure messages, so they do not garble the tqdm progress bars
+ERROR_LOG = "crawl_errors.log"
+
+# Direct urllib3 pools keyed by image host; calling a pool with just the URL's path
+# skips the per-request URL reparsing inside requests' pool-manager lookup
+_IMAGE_POOLS = {}
+
+
+def _image_pool(host):
+    """
+    Returns the urllib3 connection pool for the given image host, creating it on first use.
+
+    Args:
+        host (str): Hostname serving the images.
+
+    Returns:
+        urllib3.HTTPSConnectionPool: Connection pool for the host.
+    """
+    if host not in _IMAGE_POOLS:
+        _IMAGE_POOLS[host] = urllib3.HTTPSConnectionPool(
+            host, maxsize=64, block=False, timeout=urllib3.Timeout(connect=5, read=60)
+        )
+
+    return _IMAGE_POOLS[host]
+
+
+def _log_failure(message):
+    """
+    Appends a failure message to the error log file.
+
+    Args:
+        message (str): Message describing the failure.
+
+    Returns:
+        None
+    """
+    with open(ERROR_LOG, "a") as file:
+        file.write(f"{message}\n")
+
+
+def _write_image(filepath, data):
+    """
+    Writes image bytes to the given file path.
+
+    Args:
+        filepath (str): Path to the file where the image should be saved.
+        data (bytes): Image content to write.
+
+    Returns:
+        None
+    """
+    # Open the file in binary write mode and write the whole image at once
+    with open(filepath, "wb") as file:
+        file.write(data)
+
 
 def fetch_image(url, filepath):
     """
@@ -20,25 +145,126 @@ def fetch_image(url, filepath):
     Returns:
         bool: True if the image was successfully downloaded and saved, False otherwise.
     """
-    # Send a GET request to the URL with streaming enabled
-    response = requests.get(url, stream=True)
+    # Request the URL's path on a pre-parsed connection pool for its host; JPEGs are
+    # already compressed, so ask the server not to gzip the body
+    parts = urlsplit(url)
+    path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+    response = _image_pool(parts.netloc).urlopen(
+        "GET", path, preload_content=False, headers={"Accept-Encoding": "identity"}
+    )
 
     # Check if the request was successful (HTTP status code 200)
-    successful = response.status_code == 200
+    successful = response.status == 200
 
     if successful:
         # Open the file in binary write mode
         with open(filepath, "wb") as file:
-            # Write the image content in chunks to the file
-            for chunk in response.iter_content(2**16):
-                file.write(chunk)
+            # Stream the image content to the file through C-level copies with a 1 MiB
+            # buffer, instead of re-entering the interpreter per 64 KiB chunk
+            shutil.copyfileobj(response, file, length=2**20)
     else:
-        # Print a failure message if the request was not successful
-        print(f"Fail:       {filepath}")
+        # Log a failure message if the request was not successful
+        _log_failure(f"Fail:       {filepath}")
+
+    # Drain any unread body bytes (e.g. on the non-200 path) so the connection comes
+    # back to the pool reusable instead of being closed as dirty on its next checkout
+    response.drain_conn()
+    response.release_conn()
+
+    return successful
+
+
+async def _fetch(client, semaphore, url, filepath, existing):
+    """
+    Fetches an image from the given URL and saves it to the specified file path, bounded by the semaphore.
+
+    Args:
+        client (httpx.AsyncClient): Shared HTTP client for the downloads.
+        semaphore (asyncio.Semaphore): Semaphore bounding the number of in-flight downloads.
+        url (str): URL of the image.
+        filepath (str): Path to the file where the image should be saved.
+        existing (set): Set of already-downloaded filenames, updated on success.
+
+    Returns:
+        bool: True if the image was successfully downloaded and saved, False otherwise.
+    """
+    successful = False
+
+    async with semaphore:
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            # A transport error fails only this image; letting it propagate would abort
+            # every other in-flight task in the gather and lose the fetched metadata
+            try:
+                async with client.stream("GET", url) as response:
+                    # Back off with jitter when rate-limited, then retry the download
+                    if response.status_code == 429:
+                        await asyncio.sleep(random.uniform(0.5, 1.5) * 2**attempt)
+                        continue
+
+                    # Check if the request was successful (HTTP status code 200)
+                    successful = response.status_code == 200
+
+                    if successful:
+                        # Collect the streamed chunks and flush them with one write() per image;
+                        # batching the blocking writes keeps syscalls off the event loop's hot path
+                        chunks = []
+                        async for chunk in response.aiter_bytes(2**16):
+                            chunks.append(chunk)
+
+                        # Hand the blocking write to the I/O thread pool so the event loop keeps
+                        # pulling response bytes for the other in-flight downloads
+                        loop = asyncio.get_running_loop()
+                        await loop.run_in_executor(IO_POOL, _write_image, filepath, b"".join(chunks))
+
+                        # Record the download so later calls in this process skip the file
+                        existing.add(os.path.basename(filepath))
+                    else:
+                        # Log a failure message if the request was not successful
+                        _log_failure(f"Fail:       {filepath}")
+            except httpx.HTTPError as error:
+                # Log a failure message if the request raised a transport error
+                _log_failure(f"Fail:       {filepath} ({error})")
+
+            break
+        else:
+            # Log the failure when every rate-limited retry has been exhausted
+            _log_failure(f"Rate-limited: {filepath}")
 
     return successful
 
 
+async def _fetch_all(rows, existing):
+    """
+    Downloads all given images concurrently over one connection pool.
+
+    Args:
+        rows (list): List of (url, filepath) pairs to download.
+        existing (set): Set of already-downloaded filenames, updated on success.
+
+    Returns:
+        None
+    """
+    # Bound the number of in-flight downloads so the CDN is not flooded
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+
+    # HTTP/2 multiplexes many concurrent streams over a handful of TCP+TLS connections,
+    # so a small keep-alive pool sustains all in-flight downloads without re-handshaking
+    limits = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+
+    # JPEGs are already compressed, so ask the server not to gzip the bodies; redirects
+    # are followed to match the requests-based downloader this client replaced
+    async with httpx.AsyncClient(
+        http2=True,
+        limits=limits,
+        timeout=httpx.Timeout(300, connect=5),
+        headers={"Accept-Encoding": "identity"},
+        follow_redirects=True,
+    ) as client:
+        # Dispatch every download as a task and await them with a progress bar
+        tasks = (_fetch(client, semaphore, url, filepath, existing) for url, filepath in rows)
+        await tqdm_asyncio.gather(*tasks, desc="Fetch images")
+
+
 def fetch_images(metadata, image_dir):
     """
     Downloads images from URLs provided in the metadata DataFrame and saves them in the specified directory.
@@ -53,17 +279,40 @@ def fetch_images(metadata, image_dir):
     # Create the image directory if it doesn't exist
     os.makedirs(image_dir, exist_ok=True)
 
-    # Iterate over each row in the metadata DataFrame
-    for _, row in tqdm(tuple(metadata.iterrows()), desc="Fetch images"):
-        # Extract the URL and generate the file path for the image
-        url = row["URL"]
-        filename = f"{row['ID']}.jpg"
-        filepath = os.path.join(image_dir, filename)
+    # Scan the directory once instead of paying a stat() syscall per row
+    existing = {entry.name for entry in os.scandir(image_dir)}
+
+    # Build every filename and file path vectorized over the ID column instead of
+    # formatting a Python f-string per row
+    filenames = metadata["ID"].astype("string") + ".jpg"
+    filepaths = image_dir + os.sep + filenames
+
+    # Collect the URL and file path of each image that has not already been downloaded
+    rows = [
+        (url, filepath)
+        for url, filename, filepath in zip(metadata["URL"].to_numpy(), filenames.to_numpy(), filepaths.to_numpy())
+        if filename not in existing
+    ]
 
-        # Check if the image has not already been downloaded
-        if not os.path.exists(filepath):
-            # Fetch and save the image
-            fetch_image(url, filepath)
+    # Download the images concurrently; the workload is network-bound, so overlapping
+    # the round-trips on the event loop cuts wall time to roughly (N / concurrency) RTTs
+    asyncio.run(_fetch_all(rows, existing))
+
+
+def _cache_path(params):
+    """
+    Returns the cache file path for the given query parameters.
+
+    Args:
+        params (dict): Dictionary of query parameters.
+
+    Returns:
+        str: Path to the cache file for the query.
+    """
+    # Key on every parameter except the API key, so cache entries survive key rotation
+    key = json.dumps(sorted((k, str(v)) for k, v in params.items() if k != "key"))
+
+    return os.path.join(CACHE_DIR, f"{hashlib.sha1(key.encode()).hexdigest()}.json")
 
 
 def make_query(params):
@@ -76,31 +325,107 @@ def make_query(params):
     Returns:
         list: List of metadata dictionaries.
     """
-    # Make a request to the Pixabay API
-    if params["content_type"] == "authentic":
-        # For authentic content, make a regular request
-        response = requests.get(BASE_URL, params=params)
-    else:
-        # For AI-generated content, make a request with the 'q' parameter
-        # (query) set to 'ai_generated'
-        response = requests.get(f"{BASE_URL}?q=ai_generated", params=params)
+    # Serve a fresh cached response instead of re-paying the network round-trip
+    cache_path = _cache_path(params)
+    if os.path.exists(cache_path) and time.time() - os.path.getmtime(cache_path) < CACHE_TTL:
+        with open(cache_path, "rb") as file:
+            return orjson.loads(file.read())
+
+    # Make a request to the Pixabay API through the pooled session; the context manager
+    # returns the connection to the pool promptly for the next query to reuse
+    with SESSION.get(BASE_URL, params=params, timeout=(5, 30)) as response:
+        # Check if the request was successful
+        if response.status_code == 200:
+            # Parse the response as JSON; orjson decodes the raw bytes several times
+            # faster than the stdlib parser behind response.json(). A truncated or
+            # malformed body is logged rather than aborting the whole crawl
+            try:
+                data = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                _log_failure(f"Malformed response for params {params}")
+                data = {}
+
+            # Get the list of hits from the response
+            metadata = data.get("hits", list())
+
+            # Cache only successful responses, so rate-limited or failed queries retry
+            if metadata:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                with open(cache_path, "wb") as file:
+                    file.write(orjson.dumps(metadata))
+        else:
+            # If the request was not successful, log the response text
+            _log_failure(response.text)
+
+            # Set the metadata to an empty list
+            metadata = []
 
-    # Check if the request was successful
-    if response.status_code == 200:
-        # Parse the response as JSON
-        data = response.json()
+    return metadata
 
-        # Get the list of hits from the response
-        metadata = data.get("hits", list())
-    else:
-        # If the request was not successful, print the response text
-        print()
-        print(response.text)
 
-        # Set the metadata to an empty list
-        metadata = []
+def _build_jobs(api_key, per_page, num_images):
+    """
+    Builds one query job per (parameter combination, page).
 
-    return metadata
+    Args:
+        api_key (str): Pixabay API key.
+        per_page (int): Number of images to request per page.
+        num_images (int): Total number of images to fetch.
+
+    Returns:
+        list: List of (params, comb) pairs, one per query to make.
+    """
+    base_params = {"key": api_key, "per_page": per_page}  # Base parameters for API query
+
+    # Generate all possible combinations of the parameters
+    param_combs = tuple(product(CONTENT_TYPES, IMAGE_TYPES, ORDERS))
+
+    # Build one job per (combination, page); each job gets its own params dict
+    jobs = []
+    for comb in param_combs:
+        content_type, image_type = comb[0], comb[1]
+
+        # Hoist the per-combination parameters out of the page loop; for AI-generated
+        # content the loop-invariant 'q' (query) parameter is set to 'ai_generated'
+        # here once instead of being re-derived on every call to make_query
+        comb_params = dict(base_params, content_type=content_type, image_type=image_type)
+        if content_type != "authentic":
+            comb_params["q"] = "ai_generated"
+
+        # Calculate the number of pages to request based on the number of images and images per page
+        for page in range(1, num_images // per_page + 1):
+            jobs.append((dict(comb_params, page=page), comb))
+
+    return jobs
+
+
+def _append_images(columns, comb, images):
+    """
+    Appends each image's metadata to the per-column lists.
+
+    Args:
+        columns (dict): Dictionary mapping column names to lists of values.
+        comb (tuple): Parameter combination the images were queried with.
+        images (list): List of image metadata dictionaries returned by the API.
+
+    Returns:
+        None
+    """
+    content_type, image_type, order = comb
+
+    # Append each image's metadata column by column, so pandas can build the
+    # DataFrame directly from typed columns instead of unpacking row tuples
+    for image in images:
+        columns["ID"].append(image["id"])
+        columns["Content_Type"].append(content_type)
+        columns["Image_Type"].append(image["type"])
+        columns["Order"].append(order)
+        columns["Tags"].append(image["tags"])
+        columns["Views"].append(image["views"])
+        columns["Downloads"].append(image["downloads"])
+        columns["Likes"].append(image["likes"])
+        columns["Comments"].append(image["comments"])
+        columns["URL"].append(image["largeImageURL"])
 
 
 def fetch_metadata(api_key, per_page, num_images):
@@ -113,76 +438,81 @@ def fetch_metadata(api_key, per_page, num_images):
         num_images (int): Total number of images to fetch.
 
     Returns:
-        pd.DataFrame: DataFrame containing metadata for each of the images, including columns for ID, content type, image type, category, colors, editor choice, order, tags, views, downloads, likes, comments, and URL.
-    """
-    # Define the iterested values for content types, image types, orders
-    CONTENT_TYPES = ("authentic", "ai")
-    IMAGE_TYPES = ("photo", "illustration")
-    ORDERS = ("popular",)
-
-    # Unused parameters: categories, colors, editor choices
-    CATEGORIES = ("Unknown",)
-    COLORS = ("Unknown",)
-    EDITOR_CHOICES = ("Unknown",)
-
-    # Define the column names for the metadata DataFrame
-    COLUMNS = (
-        "ID",
-        "Content_Type",
-        "Image_Type",
-        "Category",
-        "Colors",
-        "Editor_Choice",
-        "Order",
-        "Tags",
-        "Views",
-        "Downloads",
-        "Likes",
-        "Comments",
-        "URL",
-    )
+        pd.DataFrame: DataFrame containing metadata for each of the images, including columns for ID, content type, image type, order, tags, views, downloads, likes, comments, and URL.
+    """
+    columns = {column: [] for column in COLUMNS}  # One list per column (structure of arrays)
+    jobs = _build_jobs(api_key, per_page, num_images)
 
-    metadata = []  # List to store metadata entries
-    params = {"key": api_key, "per_page": per_page}  # Base parameters for API query
+    # The API is idempotent and network-bound, so the queries can run concurrently in any order
+    with ThreadPoolExecutor(max_workers=MAX_QUERY_WORKERS) as executor:
+        futures = {executor.submit(make_query, params): comb for params, comb in jobs}
 
-    # Generate all possible combinations of the parameters
-    param_combs = tuple(product(CONTENT_TYPES, IMAGE_TYPES, CATEGORIES, COLORS, EDITOR_CHOICES, ORDERS))
+        # Collect each query's hits as it completes
+        for future in tqdm(as_completed(futures), total=len(futures), desc="Fetch metadata"):
+            _append_images(columns, futures[future], future.result())
 
-    # Iterate over each combination of parameters
-    for content_type, image_type, category, colors, editors_choice, order in tqdm(param_combs, desc="Fetch metadata"):
-        # Set the specific parameters for this combination
-        params["content_type"] = content_type
-        params["image_type"] = image_type
+    # Return the metadata as a pandas DataFrame; the same image can match several
+    # query combinations, so keep only the first row per ID
+    return pd.DataFrame(columns).drop_duplicates(subset=["ID"], keep="first")
 
-        # Calculate the number of pages to request based on the number of images and images per page
-        for page in range(1, num_images // per_page + 1):
-            params["page"] = page  # Set the current page number
-
-            # Make a query to the Pixabay API with the current parameters
-            response = make_query(params)
-
-            # Append each image's metadata to the list
-            for image in response:
-                metadata.append(
-                    (
-                        image["id"],
-                        content_type,
-                        image["type"],
-                        category,
-                        colors,
-                        editors_choice,
-                        order,
-                        image["tags"],
-                        image["views"],
-                        image["downloads"],
-                        image["likes"],
-                        image["comments"],
-                        image["largeImageURL"],
-                    )
-                )
-
-    # Return the metadata as a pandas DataFrame
-    return pd.DataFrame(metadata, columns=COLUMNS)
+
+async def _pipeline(jobs, image_dir, existing):
+    """
+    Fetches metadata and downloads the referenced images concurrently.
+
+    Each page's images start downloading as soon as its metadata arrives, overlapping
+    the two network-bound phases instead of running them back to back.
+
+    Args:
+        jobs (list): List of (params, comb) query jobs to run.
+        image_dir (str): Directory where images will be saved.
+        existing (set): Set of already-downloaded filenames, updated on success.
+
+    Returns:
+        dict: Dictionary mapping column names to lists of metadata values.
+    """
+    columns = {column: [] for column in COLUMNS}  # One list per column (structure of arrays)
+    seen = set()  # IDs already dispatched for download, across overlapping queries
+
+    # Bound the two stages independently so neither can starve the other
+    query_semaphore = asyncio.Semaphore(MAX_QUERY_WORKERS)
+    download_semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+
+    # HTTP/2 multiplexes many concurrent streams over a handful of TCP+TLS connections
+    limits = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+
+    # JPEGs are already compressed, so ask the server not to gzip the bodies; redirects
+    # are followed to match the requests-based downloader this client replaced
+    async with httpx.AsyncClient(
+        http2=True,
+        limits=limits,
+        timeout=httpx.Timeout(300, connect=5),
+        headers={"Accept-Encoding": "identity"},
+        follow_redirects=True,
+    ) as client:
+
+        async def run_job(params, comb):
+            # Producer stage: run the blocking query on a worker thread
+            async with query_semaphore:
+                images = await asyncio.to_thread(make_query, params)
+            _append_images(columns, comb, images)
+
+            # Consumer stage: start downloading this page's unseen images immediately
+            downloads = []
+            for image in images:
+                filename = f"{image['id']}.jpg"
+                if image["id"] in seen or filename in existing:
+                    continue
+                seen.add(image["id"])
+                filepath = os.path.join(image_dir, filename)
+                downloads.append(_fetch(client, download_semaphore, image["largeImageURL"], filepath, existing))
+            await asyncio.gather(*downloads)
+
+        # Dispatch every job as a task and await them with a progress bar
+        tasks = (run_job(params, comb) for params, comb in jobs)
+        await tqdm_asyncio.gather(*tasks, desc="Fetch dataset")
+
+    return columns
 
 
 def build_dataset(args):
@@ -195,22 +525,44 @@ def build_dataset(args):
     Returns:
         None
     """
-    csv_path = os.path.join(args.save_dir, args.csv_file)
+    metadata_path = os.path.join(args.save_dir, args.metadata_file)
     image_dir = os.path.join(args.save_dir, args.image_dir)
 
-    # Load existing metadata from CSV if it already exists
-    if os.path.exists(csv_path):
-        metadata = pd.read_csv(csv_path)
+    # Load existing metadata if it already exists; Parquet round-trips exact dtypes,
+    # while CSV stays supported for previously collected datasets. Only the ID and URL
+    # columns feed the image downloads, so the other eleven are never parsed
+    if os.path.exists(metadata_path):
+        if metadata_path.endswith(".parquet"):
+            metadata = pd.read_parquet(metadata_path, columns=["ID", "URL"])
+        else:
+            metadata = pd.read_csv(metadata_path, usecols=["ID", "URL"], dtype={"ID": "int64", "URL": "string"})
+
+        # Previously collected files may still contain duplicate IDs
+        metadata = metadata.drop_duplicates(subset=["ID"], keep="first")
+
+        # Fetch images from Pixabay based on the metadata
+        fetch_images(metadata, image_dir)
 
-    # Otherwise, fetch metadata from Pixabay API
+    # Otherwise, fetch metadata and images from Pixabay in one overlapped pipeline
     else:
-        metadata = fetch_metadata(args.api_key, args.per_page, args.num_images)
+        os.makedirs(image_dir, exist_ok=True)
 
-        # Save the metadata to a CSV file
-        metadata.to_csv(csv_path, index=False)
+        # Scan the directory once instead of paying a stat() syscall per row
+        existing = {entry.name for entry in os.scandir(image_dir)}
 
-    # Fetch images from Pixabay based on the metadata
-    fetch_images(metadata, image_dir)
+        # Run the metadata queries and image downloads concurrently
+        jobs = _build_jobs(args.api_key, args.per_page, args.num_images)
+        columns = asyncio.run(_pipeline(jobs, image_dir, existing))
+
+        # The same image can match several query combinations, so keep one row per ID
+        metadata = pd.DataFrame(columns).drop_duplicates(subset=["ID"], keep="first")
+
+        # Save the metadata; zstd-compressed Parquet serializes the columns in C instead
+        # of to_csv's per-value Python formatting, with CSV kept as an export format
+        if metadata_path.endswith(".parquet"):
+            metadata.to_parquet(metadata_path, compression="zstd")
+        else:
+            metadata.to_csv(metadata_path, index=False)
 
 
 def parse_args():
@@ -232,8 +584,9 @@ def parse_args():
     # Output directory for the images
     IMAGE_DIR = "images"
 
-    # CSV file for storing the metadata
-    CSV_FILE = "metadata.csv"
+    # File for storing the metadata; Parquet preserves dtypes exactly and is much
+    # faster to read back than CSV
+    METADATA_FILE = "metadata.parquet"
 
     # Number of images to fetch per page
     PER_PAGE = 200
@@ -252,8 +605,10 @@ def parse_args():
     # Set the default output directory for the images
     parser.add_argument("--image_dir", default=IMAGE_DIR, type=str, help="Output directory for the images")
 
-    # Set the default CSV file for metadata
-    parser.add_argument("--csv_file", default=CSV_FILE, type=str, help="CSV file for metadata")
+    # Set the default file for metadata
+    parser.add_argument(
+        "--metadata_file", default=METADATA_FILE, type=str, help="Parquet or CSV file for metadata"
+    )
 
     # Set the default number of images to fetch per page
     parser.add_argument("--per_page", default=PER_PAGE, type=int, help="Number of images per page")